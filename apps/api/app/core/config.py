@@ -42,6 +42,12 @@ class Settings(BaseSettings):
     # GitHub
     GITHUB_USERNAME: str = "googa27"
     GITHUB_API_URL: str = "https://api.github.com"
+    GITHUB_TOKEN: str = os.getenv("GITHUB_TOKEN", "")
+    GITHUB_MAX_CONCURRENCY: int = int(os.getenv("GITHUB_MAX_CONCURRENCY", "8"))
+    GITHUB_HTTP2: bool = os.getenv("GITHUB_HTTP2", "true").lower() == "true"
+    GITHUB_TIMEOUT_SECONDS: float = float(os.getenv("GITHUB_TIMEOUT_SECONDS", "10"))
+    # ETag cache directory; empty keeps conditional-request validators in memory
+    GITHUB_CACHE_DIR: str = os.getenv("GITHUB_CACHE_DIR", ".cache/github")
 
     model_config = SettingsConfigDict(env_file=".env")
 
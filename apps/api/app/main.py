@@ -1,8 +1,19 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from app.core.config import settings
 from app.routers import health, projects, contact, ai, cv
+from app.services.github_service import github_service
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release pooled outbound clients when the server stops."""
+    yield
+    await github_service.aclose()
+
 
 app = FastAPI(
     title="Cristobal Portfolio API",
@@ -10,6 +21,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -3,13 +3,12 @@ import json
 from sqlalchemy.orm import Session
 from app.schemas.project import Project, ProjectList, ShowcaseResponse
 from app.core.database import get_db
-from app.services.github_service import GitHubService
+from app.services.github_service import github_service
 from app.services.project_service import ProjectService
 from app.services.scoring import scoring_service
 from app.services.showcase_service import showcase_service
 
 router = APIRouter()
-github_service = GitHubService()
 
 
 @router.get("/projects", response_model=ProjectList)
@@ -0,0 +1,6 @@
+"""GitHub adapter: pooled REST client and project sync pipeline."""
+
+from app.services.github_service.cache import ConditionalRequestCache
+from app.services.github_service.service import GitHubService, github_service
+
+__all__ = ["ConditionalRequestCache", "GitHubService", "github_service"]
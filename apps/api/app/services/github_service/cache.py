@@ -0,0 +1,115 @@
+"""Conditional-request (ETag / Last-Modified) cache for GitHub responses."""
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Response headers replayed on a cache hit; Link keeps pagination working
+_REPLAYED_HEADERS = ("content-type", "etag", "last-modified", "link")
+
+
+@dataclass
+class CacheEntry:
+    """Validators and body of the last 200 response for one request."""
+
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    headers: Dict[str, str]
+    body: str
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers that turn the next request into a conditional GET."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        """Rebuild the cached 200 response for a ``304 Not Modified``."""
+        return httpx.Response(
+            200, headers=self.headers, content=self.body.encode(), request=request
+        )
+
+
+class ConditionalRequestCache:
+    """
+    Per-URL store of ETag/Last-Modified validators and response bodies.
+
+    Entries live in memory and, when ``directory`` is set, are persisted as
+    one JSON file per request key so validators survive restarts. A 304
+    does not count against GitHub's primary rate limit, so a sync over
+    unchanged repositories costs almost no quota or bandwidth.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = Path(directory) if directory else None
+        self._entries: Dict[str, CacheEntry] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(url: str, accept: str = "") -> str:
+        """Cache key for a URL (including query) and its Accept header."""
+        return hashlib.sha256(f"{accept} {url}".encode()).hexdigest()
+
+    def _path(self, key: str) -> Optional[Path]:
+        return self.directory / f"{key}.json" if self.directory else None
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the entry for ``key`` from memory, falling back to disk."""
+        entry = self._entries.get(key)
+        path = self._path(key)
+        if entry is None and path is not None and path.is_file():
+            try:
+                entry = CacheEntry(**json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning("Ignoring unreadable GitHub cache entry %s: %s", path, e)
+                return None
+            self._entries[key] = entry
+        return entry
+
+    def store(self, key: str, response: httpx.Response) -> None:
+        """Remember a 200 response if GitHub sent a validator for it."""
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if not etag and not last_modified:
+            return
+        entry = CacheEntry(
+            url=str(response.request.url),
+            etag=etag,
+            last_modified=last_modified,
+            headers={
+                name: response.headers[name]
+                for name in _REPLAYED_HEADERS
+                if name in response.headers
+            },
+            body=response.text,
+        )
+        self._entries[key] = entry
+        path = self._path(key)
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(json.dumps(asdict(entry)), encoding="utf-8")
+            except OSError as e:
+                logger.warning("Could not persist GitHub cache entry %s: %s", path, e)
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters since start-up."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+        }
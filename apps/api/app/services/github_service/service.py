@@ -0,0 +1,311 @@
+"""GitHub REST adapter with one pooled client and bounded fan-out."""
+
+import asyncio
+import importlib.util
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+import httpx
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.time import parse_utc
+from app.services.github_service.cache import ConditionalRequestCache
+from app.services.project_service import ProjectService
+
+logger = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional ``h2`` package behind httpx."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class GitHubService:
+    """Service for interacting with GitHub API"""
+
+    # GitHub's maximum page size for repository listings
+    PER_PAGE = 100
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        max_concurrency: Optional[int] = None,
+        cache: Optional[ConditionalRequestCache] = None,
+    ):
+        self.base_url = settings.GITHUB_API_URL
+        self.username = settings.GITHUB_USERNAME
+        self.headers = {
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "Cristobal-Portfolio-Bot",
+        }
+        if settings.GITHUB_TOKEN:
+            self.headers["Authorization"] = f"Bearer {settings.GITHUB_TOKEN}"
+        self.max_concurrency = max(
+            1, max_concurrency or settings.GITHUB_MAX_CONCURRENCY
+        )
+        # An injected client is borrowed; a lazily created one is owned and
+        # reused by every request until ``aclose`` (app shutdown).
+        self._client = client
+        self._owns_client = client is None
+        self.cache = cache or ConditionalRequestCache(settings.GITHUB_CACHE_DIR)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the long-lived client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=settings.GITHUB_HTTP2 and _http2_available(),
+                timeout=settings.GITHUB_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+            self._owns_client = True
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client if this service created it."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """
+        GET ``url`` on the pooled client and raise on HTTP errors.
+
+        Requests are made conditional on the cached ETag/Last-Modified and a
+        ``304 Not Modified`` is answered from the cache as a 200.
+        """
+        headers = dict(headers or self.headers)
+        request_url = str(httpx.URL(url, params=params))
+        key = self.cache.key(request_url, headers.get("Accept", ""))
+        entry = self.cache.get(key)
+        if entry is not None:
+            headers.update(entry.conditional_headers())
+
+        response = await self._get_client().get(request_url, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            self.cache.hits += 1
+            return entry.to_response(response.request)
+
+        response.raise_for_status()
+        self.cache.misses += 1
+        self.cache.store(key, response)
+        return response
+
+    async def _get_json(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Any:
+        """GET ``url`` on the pooled client and decode the JSON body."""
+        return (await self._get(url, headers=headers)).json()
+
+    async def iter_user_repo_pages(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield the user's repositories one page at a time.
+
+        Follows ``Link: rel="next"`` headers with ``per_page=100`` so callers
+        can process a page while holding no more than one page in memory.
+        """
+        url: Optional[str] = f"{self.base_url}/users/{self.username}/repos"
+        params: Optional[Dict[str, Any]] = {"per_page": self.PER_PAGE}
+        while url:
+            response = await self._get(url, params=params)
+            yield response.json()
+            # The next link already carries the query string
+            url = response.links.get("next", {}).get("url")
+            params = None
+
+    async def fetch_user_repos(self) -> List[Dict[str, Any]]:
+        """Fetch all public repositories for the user"""
+        repos: List[Dict[str, Any]] = []
+        async for page in self.iter_user_repo_pages():
+            repos.extend(page)
+        return repos
+
+    async def fetch_repo_details(self, repo_name: str) -> Dict[str, Any]:
+        """Fetch detailed information about a specific repository"""
+        url = f"{self.base_url}/repos/{self.username}/{repo_name}"
+        return await self._get_json(url)
+
+    async def fetch_repo_topics(self, repo_name: str) -> List[str]:
+        """Fetch topics for a specific repository"""
+        url = f"{self.base_url}/repos/{self.username}/{repo_name}/topics"
+        headers = self.headers.copy()
+        headers["Accept"] = "application/vnd.github.mercy-preview+json"
+        data = await self._get_json(url, headers=headers)
+        return data.get("names", [])
+
+    async def fetch_topics_concurrently(
+        self, repos: Sequence[Dict[str, Any]]
+    ) -> List[List[str] | BaseException]:
+        """
+        Fetch topics for many repositories with at most ``max_concurrency``
+        requests in flight.
+
+        Results keep the order of ``repos``; a failed fetch is returned as
+        its exception so one bad repository does not abort the batch.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(repo: Dict[str, Any]) -> List[str]:
+            async with semaphore:
+                return await self.fetch_repo_topics(repo["name"])
+
+        return await asyncio.gather(
+            *(fetch(repo) for repo in repos), return_exceptions=True
+        )
+
+    def transform_repo_data(
+        self, repo_data: Dict[str, Any], topics: List[str] = None
+    ) -> Dict[str, Any]:
+        """Transform GitHub repository data to our database format"""
+        return {
+            "github_id": repo_data["id"],
+            "name": repo_data["name"],
+            "description": repo_data.get("description", ""),
+            "language": repo_data.get("language", "Unknown"),
+            "url": repo_data["html_url"],
+            "stars": repo_data.get("stargazers_count", 0),
+            "forks": repo_data.get("forks_count", 0),
+            "topics": topics or [],
+            "is_featured": self._is_featured_repo(repo_data, topics or []),
+            "created_at": parse_utc(repo_data.get("created_at")),
+            "updated_at": parse_utc(repo_data.get("updated_at")),
+        }
+
+    def _is_featured_repo(self, repo_data: Dict[str, Any], topics: List[str]) -> bool:
+        """Determine if a repository should be featured"""
+        # Featured criteria: high stars, specific topics, or important names
+        important_topics = {
+            "machine-learning",
+            "ml",
+            "ai",
+            "data-science",
+            "quantitative-finance",
+            "pde",
+            "optimization",
+        }
+        important_names = {
+            "options-pricing",
+            "finite-difference",
+            "optimization",
+            "django",
+            "mlflow",
+        }
+
+        # Check if it has important topics
+        if any(topic.lower() in important_topics for topic in topics):
+            return True
+
+        # Check if it has important names
+        repo_name = repo_data["name"].lower()
+        if any(name in repo_name for name in important_names):
+            return True
+
+        # Check if it has significant engagement
+        if repo_data.get("stargazers_count", 0) >= 5:
+            return True
+
+        return False
+
+    async def _sync_page(
+        self, db: Session, repos: List[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """Fetch topics for one page of public repos and write them."""
+        created_count = 0
+        updated_count = 0
+
+        # Topic requests fan out concurrently; DB writes stay sequential
+        # because a Session is not safe to share between tasks.
+        topic_results = await self.fetch_topics_concurrently(repos)
+
+        for repo, topics in zip(repos, topic_results):
+            try:
+                if isinstance(topics, BaseException):
+                    raise topics
+
+                # Transform the data
+                project_data = self.transform_repo_data(repo, topics)
+
+                # Check if project already exists
+                existing_project = ProjectService.get_project_by_github_id(
+                    db, repo["id"]
+                )
+
+                if existing_project:
+                    # Update existing project
+                    ProjectService.create_or_update_project(db, project_data)
+                    updated_count += 1
+                else:
+                    # Create new project
+                    ProjectService.create_or_update_project(db, project_data)
+                    created_count += 1
+
+            except Exception as e:
+                logger.warning("Error processing repo %s: %s", repo["name"], e)
+                continue
+
+        return {"created": created_count, "updated": updated_count}
+
+    async def sync_projects_to_database(self, db: Session) -> Dict[str, Any]:
+        """Sync all GitHub projects to the database"""
+        result: Dict[str, Any] = {"total_repos": 0, "created": 0, "updated": 0}
+        pages = self.iter_user_repo_pages()
+        # Request page N+1 while page N is transformed and written
+        next_page = asyncio.ensure_future(anext(pages, None))
+        try:
+            while (repos := await next_page) is not None:
+                next_page = asyncio.ensure_future(anext(pages, None))
+
+                # Filter only public repositories
+                public_repos = [repo for repo in repos if not repo.get("private", True)]
+
+                page_result = await self._sync_page(db, public_repos)
+                result["total_repos"] += len(public_repos)
+                result["created"] += page_result["created"]
+                result["updated"] += page_result["updated"]
+
+            result["cache"] = self.cache.stats()
+            return result
+
+        except Exception as e:
+            logger.error("Error syncing projects: %s", e)
+            raise
+
+        finally:
+            # Settle the prefetch before closing the generator it drives
+            next_page.cancel()
+            await asyncio.gather(next_page, return_exceptions=True)
+            await pages.aclose()
+
+    async def get_featured_projects(
+        self, db: Session, limit: int = 6
+    ) -> List[Dict[str, Any]]:
+        """Get featured projects from database"""
+        projects = ProjectService.get_featured_projects(db, limit)
+        return [
+            {
+                "id": p.id,
+                "name": p.name,
+                "description": p.description,
+                "language": p.language,
+                "url": p.url,
+                "stars": p.stars,
+                "forks": p.forks,
+                "topics": json.loads(p.topics) if p.topics else [],
+                "is_featured": p.is_featured,
+                "updated_at": p.updated_at.isoformat() if p.updated_at else None,
+            }
+            for p in projects
+        ]
+
+
+# Shared instance so routers and app shutdown reuse one connection pool
+github_service = GitHubService()
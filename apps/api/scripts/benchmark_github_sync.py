@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark the GitHub sync engine against a local fake GitHub server.
+
+Compares the legacy path (a new client and connection for every
+request, topics fetched one repository at a time) with the pooled client
+and bounded fan-out used by ``GitHubService``.
+
+Usage (from apps/api):
+    python scripts/benchmark_github_sync.py --repos 200 --latency-ms 50
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+from aiohttp import web
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.services.github_service import GitHubService  # noqa: E402
+
+
+def build_fake_github(repo_count: int, latency: float) -> web.Application:
+    """Serve ``/users/{user}/repos`` and per-repo topics with fixed latency."""
+
+    async def list_repos(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        repos = [
+            {
+                "id": index,
+                "name": f"repo-{index}",
+                "html_url": f"https://github.com/bench/repo-{index}",
+                "private": False,
+                "updated_at": "2024-01-01T00:00:00Z",
+            }
+            for index in range(repo_count)
+        ]
+        return web.json_response(repos)
+
+    async def topics(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        return web.json_response({"names": ["python", "benchmark"]})
+
+    app = web.Application()
+    app.router.add_get("/users/{user}/repos", list_repos)
+    app.router.add_get("/repos/{user}/{repo}/topics", topics)
+    return app
+
+
+async def legacy_fetch(service: GitHubService) -> int:
+    """Reproduce the pre-pooling behaviour: sequential, one client each."""
+    async with httpx.AsyncClient() as client:
+        response = await client.get(
+            f"{service.base_url}/users/{service.username}/repos"
+        )
+        repos = response.json()
+    for repo in repos:
+        async with httpx.AsyncClient() as client:
+            url = f"{service.base_url}/repos/{service.username}/{repo['name']}/topics"
+            (await client.get(url)).raise_for_status()
+    return len(repos)
+
+
+async def pooled_fetch(service: GitHubService) -> int:
+    """Fetch through the shared client with bounded concurrency."""
+    repos = await service.fetch_user_repos()
+    results = await service.fetch_topics_concurrently(repos)
+    return len(results)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repos", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    runner = web.AppRunner(build_fake_github(args.repos, args.latency_ms / 1000))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+
+    service = GitHubService(max_concurrency=args.concurrency)
+    service.base_url = f"http://127.0.0.1:{port}"
+    try:
+        for label, run in (("legacy", legacy_fetch), ("pooled", pooled_fetch)):
+            started = time.perf_counter()
+            count = await run(service)
+            elapsed = time.perf_counter() - started
+            print(f"{label:>7}: {count} repos in {elapsed:.2f}s")
+    finally:
+        await service.aclose()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
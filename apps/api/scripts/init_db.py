@@ -3,6 +3,7 @@
 Database initialization script for Cristobal Portfolio API
 """
 
+import asyncio
 import sys
 import os
 
@@ -20,6 +21,15 @@ def init_database():
     print("✅ Database tables created successfully")
 
 
+async def _sync(db):
+    """Run one sync on a dedicated pooled client and close it afterwards."""
+    github_service = GitHubService()
+    try:
+        return await github_service.sync_projects_to_database(db)
+    finally:
+        await github_service.aclose()
+
+
 def sync_github_projects():
     """Sync projects from GitHub to database"""
     print("Syncing projects from GitHub...")
@@ -28,8 +38,7 @@ def sync_github_projects():
     db = SessionLocal()
 
     try:
-        github_service = GitHubService()
-        result = github_service.sync_projects_to_database(db)
+        result = asyncio.run(_sync(db))
         print(f"✅ GitHub sync completed: {result}")
     except Exception as e:
         print(f"❌ GitHub sync failed: {e}")
@@ -3,6 +3,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 import json
 
+from app.core.config import settings
 from app.core.time import utc_now
 from app.models.database import (
     Base,
@@ -21,6 +22,12 @@ engine = create_engine(
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def isolated_github_cache(tmp_path, monkeypatch):
+    """Keep GitHub conditional-request cache files out of the source tree."""
+    monkeypatch.setattr(settings, "GITHUB_CACHE_DIR", str(tmp_path / "github"))
+
+
 @pytest.fixture
 def db_session():
     """Create a test database session."""
@@ -1,6 +1,9 @@
+import asyncio
 from datetime import UTC
 
-from app.services.github_service import GitHubService
+import httpx
+
+from app.services.github_service import ConditionalRequestCache, GitHubService
 from app.services.project_service import ProjectService
 
 
@@ -56,3 +59,197 @@ class TestGitHubService:
         project = ProjectService.create_or_update_project(db_session, transformed)
         assert project.created_at.tzinfo is UTC
         assert project.updated_at.tzinfo is UTC
+
+
+def _fake_github_transport(repo_count: int, state: dict) -> httpx.MockTransport:
+    """Local GitHub stand-in that records peak in-flight topic requests."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/repos") and "/users/" in request.url.path:
+            repos = [
+                {
+                    "id": index,
+                    "name": f"repo-{index}",
+                    "html_url": f"https://github.com/test/repo-{index}",
+                    "private": False,
+                    "updated_at": "2024-01-01T00:00:00Z",
+                }
+                for index in range(repo_count)
+            ]
+            return httpx.Response(200, json=repos)
+
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        if request.url.path.endswith("repo-3/topics"):
+            return httpx.Response(500)
+        return httpx.Response(200, json={"names": ["python"]})
+
+    return httpx.MockTransport(handler)
+
+
+class TestGitHubSync:
+    """Test the pooled, bounded-concurrency sync engine."""
+
+    async def test_topic_fan_out_respects_concurrency_limit(self):
+        state = {"in_flight": 0, "peak": 0}
+        client = httpx.AsyncClient(transport=_fake_github_transport(12, state))
+        service = GitHubService(client=client, max_concurrency=4)
+
+        repos = await service.fetch_user_repos()
+        results = await service.fetch_topics_concurrently(repos)
+
+        assert len(results) == 12
+        assert 1 < state["peak"] <= 4
+        assert isinstance(results[3], httpx.HTTPStatusError)
+        assert results[0] == ["python"]
+        await service.aclose()
+        assert not client.is_closed
+        await client.aclose()
+
+    async def test_sync_skips_failed_repos_and_counts_writes(self, db_session):
+        state = {"in_flight": 0, "peak": 0}
+        client = httpx.AsyncClient(transport=_fake_github_transport(6, state))
+        service = GitHubService(client=client, max_concurrency=3)
+
+        result = await service.sync_projects_to_database(db_session)
+        assert (result["total_repos"], result["created"], result["updated"]) == (
+            6,
+            5,
+            0,
+        )
+
+        result = await service.sync_projects_to_database(db_session)
+        assert (result["total_repos"], result["created"], result["updated"]) == (
+            6,
+            0,
+            5,
+        )
+        await client.aclose()
+
+    async def test_owned_client_is_reused_until_closed(self):
+        service = GitHubService()
+        client = service._get_client()
+        assert service._get_client() is client
+        await service.aclose()
+        assert client.is_closed
+
+
+def _paginated_transport(pages: int, per_page: int, state: dict) -> httpx.MockTransport:
+    """Serve repository pages linked through ``Link: rel="next"`` headers."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/topics"):
+            return httpx.Response(200, json={"names": []})
+
+        state["requests"].append(str(request.url))
+        page = int(request.url.params.get("page", "1"))
+        repos = [
+            {
+                "id": page * 1000 + index,
+                "name": f"repo-{page}-{index}",
+                "html_url": f"https://github.com/test/repo-{page}-{index}",
+                "private": index == 0,
+            }
+            for index in range(per_page)
+        ]
+        headers = {}
+        if page < pages:
+            next_url = request.url.copy_merge_params({"page": page + 1})
+            headers["Link"] = f'<{next_url}>; rel="next", <{request.url}>; rel="last"'
+        return httpx.Response(200, json=repos, headers=headers)
+
+    return httpx.MockTransport(handler)
+
+
+class TestGitHubPagination:
+    """Test Link-header pagination of repository listings."""
+
+    async def test_pages_follow_next_links_with_max_page_size(self):
+        state: dict = {"requests": []}
+        client = httpx.AsyncClient(transport=_paginated_transport(3, 4, state))
+        service = GitHubService(client=client)
+
+        pages = [page async for page in service.iter_user_repo_pages()]
+
+        assert [len(page) for page in pages] == [4, 4, 4]
+        assert "per_page=100" in state["requests"][0]
+        assert "page=3" in state["requests"][2]
+        assert len(await service.fetch_user_repos()) == 12
+        await client.aclose()
+
+    async def test_sync_streams_every_page_into_the_database(self, db_session):
+        state: dict = {"requests": []}
+        client = httpx.AsyncClient(transport=_paginated_transport(3, 4, state))
+        service = GitHubService(client=client)
+
+        result = await service.sync_projects_to_database(db_session)
+
+        assert (result["total_repos"], result["created"], result["updated"]) == (
+            9,
+            9,
+            0,
+        )
+        assert len(state["requests"]) == 3
+        await client.aclose()
+
+
+def _etag_transport(state: dict) -> httpx.MockTransport:
+    """Answer matching ``If-None-Match`` requests with 304 Not Modified."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        state["requests"] += 1
+        etag = f'"{request.url.path}-v{state["version"]}"'
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        if request.url.path.endswith("/topics"):
+            return httpx.Response(200, json={"names": ["pde"]}, headers={"ETag": etag})
+        repos = [{"id": 1, "name": "solver", "html_url": "https://github.com/t/s"}]
+        return httpx.Response(
+            200,
+            json=[{**repo, "private": False} for repo in repos],
+            headers={"ETag": etag},
+        )
+
+    return httpx.MockTransport(handler)
+
+
+class TestConditionalRequestCache:
+    """Test ETag revalidation of GitHub responses."""
+
+    async def test_not_modified_responses_are_served_from_cache(self, tmp_path):
+        state = {"requests": 0, "version": 1}
+        client = httpx.AsyncClient(transport=_etag_transport(state))
+        cache = ConditionalRequestCache(str(tmp_path))
+        service = GitHubService(client=client, cache=cache)
+
+        assert await service.fetch_repo_topics("solver") == ["pde"]
+        assert await service.fetch_repo_topics("solver") == ["pde"]
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+        state["version"] = 2
+        assert await service.fetch_repo_topics("solver") == ["pde"]
+        assert cache.stats()["misses"] == 2
+        await client.aclose()
+
+    async def test_validators_persist_across_service_instances(
+        self, tmp_path, db_session
+    ):
+        state = {"requests": 0, "version": 1}
+        client = httpx.AsyncClient(transport=_etag_transport(state))
+        first = GitHubService(
+            client=client, cache=ConditionalRequestCache(str(tmp_path))
+        )
+        await first.sync_projects_to_database(db_session)
+
+        second = GitHubService(
+            client=client, cache=ConditionalRequestCache(str(tmp_path))
+        )
+        result = await second.sync_projects_to_database(db_session)
+
+        assert result["cache"]["hits"] == 2
+        assert result["cache"]["misses"] == 0
+        assert result["updated"] == 1
+        await client.aclose()